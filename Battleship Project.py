@@ -10,8 +10,8 @@ Created on Fri Nov  8 00:37:23 2024
 #     - GUI is based on Python tkinter
 #     - use winsound (on Windows) to play game sound wave files
 #     - use os.system(afplay) (on Mac, not tested) to play game sound wave files
-#     - sound playing is run a separate thread so that UI thread is not blocked
-#     - timer thread to keep updating game time
+#     - sound playing is run a separate thread so that UI thread is not blocked, game sounds are queued to it
+#     - timer scheduled on UI thread to keep updating game time
 #     - Two views:
 #       * Main View UI: three panels(Greeting, Player skill selection, Buttons for Play, Exit, Sound On/Off)
 #       * Game View UI: three panels(Game Board, Game Information, Buttons for Quit and Sound On/Off)
@@ -34,16 +34,15 @@ Created on Fri Nov  8 00:37:23 2024
 # Green Grid Image: https://poki.com/en/g/battleship-war
 # Sound Effect: https://www.freesoundeffects.com/free-sounds/explosion-10070/
 
-from datetime import datetime  # use different seeds to generate different random patterns
-from random import seed, randint   # for randomly place ships on board
+from random import randint   # for randomly place ships on board, seeded from OS randomness at import
 import time      # for time function
 import sys       # for sys argv platform
 import os        # get sound play on mac
 from os import getcwd   # get current working directory
 from PIL import Image, ImageDraw, ImageFont, ImageTk    # image functions
 import tkinter as ui       # graphic user interface
-from tkinter import messagebox
 import threading           # sound playing and UI should be on different threads
+import queue               # sound waves are handed over to sound playing thread
 if sys.platform == 'win32':
     import winsound            # sound play on windows
 
@@ -55,9 +54,14 @@ hits_needed = 0        # the number of missile hits to sink all ships
 ships_total = 0        # the number of ships
 ships_sunken = 0       # the number of ships had been sunken
 
-image_missiles = []   # list of images for firing missile animation
+missile_frames = 30   # number of frames of firing missile animation
+missile_atlas = None  # sprite sheet of firing missile animation, frames stacked from top to bottom
 hit_jpg = None        # last animation image if ship is hit
 missed_jpg = None     # last animation image if ship is not hit
+missile_photos = []   # list of photos for firing missile animation, cropped once from missile_atlas
+hit_photo = None      # photo of hit_jpg
+missed_photo = None   # photo of missed_jpg
+missile_show = None   # label to display missile launch animation
 
 # view is divided into upper, middle and lower panels
 upper_fraction = 0.7
@@ -71,14 +75,17 @@ lower_panel = None
 sound_button = None # button handle for sound on/off
 
 # panels of game view
+game_root_frame = None    # parent frame of all game view panels
 game_upper_panel = None
 game_middle_panel = None
 game_lower_panel = None
 game_sound_button = None  # button handle on game view to turn sound on/off
 game_quit_button = None   # button handle on game view to quit game
-game_image = None         # game image containing initial grid lines
-game_photo = None         # game photo image based on game states
-game_upper_label = None   # label to display game photo
+grid_background = None    # ocean image with grid lines, drawn once as board size never changes
+dirty_cells = set()       # grids (row*cols + col) changed since the board was last drawn
+game_photo = None         # photo of ocean with grid lines, background of game canvas, built once and reused
+game_canvas = None        # canvas to display game board
+grid_items = []           # canvas image items of grids, indexed by row*cols + col
 game_coord_label = None   # label to display where the missile is pointing to
 game_hits_label = None    # label to display the number of missile hits
 game_miss_label = None    # label to display the number of missiles missed
@@ -90,6 +97,9 @@ game_start_time = 0    # game start time
 game_missile_left = 0  # the number of missiles still available for game
 game_hits = 0          # the number of missiles did hit ships
 game_miss = 0          # the number of missiles did not ship
+aim_position = None     # latest mouse location (x, y) on game board, None if not on board
+aim_scheduled = False   # flag indicates missile aiming location update is scheduled
+aim_cell = None         # grid (row, col) shown by game_coord_label, None if label is empty
 # missile aiming region limits
 game_mouse_x_min = 0
 game_mouse_x_max = 0
@@ -97,8 +107,9 @@ game_mouse_y_min = 0
 game_mouse_y_max = 0
 
 gaming = False     # flag indicates game is active
+animating = False  # flag indicates missile launch animation is running
 exiting = False    # flag indicates exiting program
-timer_thread = None
+game_timer = None  # scheduled call to update game time
 mute_flag = False  # flag indicates mute sound
 
 # grids
@@ -114,101 +125,61 @@ GRID_SHIP_BOMBED = 4         # spot for ship, hit by missile
 GRID_SHIP_BURNT = 8          # spot for ship, sunken
 GRID_SHIP_SCALE = 10         # scale factor, ten's digit indicates the length of ship, one's digit is ship status
 
-ship_locations = []   # initial ship layout on the board
-game_data = []        # active game data (grid values of the board)
+ship_locations = b""           # initial ship layout on the board
+game_data = bytearray()       # active game data (grid values of the board), grid (row, col) at row*cols + col
+# grid (row, col) and its neighbouring grids on the board, indexed by row*cols + col
+grid_neighbours = [[r*cols + c for r in range(max(0, row-1), min(rows, row+2))
+                    for c in range(max(0, col-1), min(cols, col+2))]
+                   for row in range(rows) for col in range(cols)]
 
 # board drawing parameters
 left_margin, right_margin = 80, 80
 grid_width, grid_height, upper_height = 0, 0, 0
 line_width = 2
+grid_resample = Image.NEAREST   # grid images are small, nearest neighbour resizing is faster than bilinear
+row_lut, col_lut = b"", b""       # board row of each pixel row and board column of each pixel column
+grid_offsets = []                 # pixel offsets of grids, indexed by row*cols + col
+# missile aiming text of each grid, indexed by [row][col]
+aim_texts = [["Aim at ({:1d},{:1d})".format(row, col) for col in range(cols)] for row in range(rows)]
 # image or photo handles
 radar_photo = None
-grid_ship_good_jpg = None
-grid_ship_burning_jpg = None
-grid_ship_burnt_jpg = None
-grid_water_cleared_jpg = None
-grid_water_obstructed_jpg = None
+grid_ship_good_photo = None
+grid_ship_burning_photo = None
+grid_ship_burnt_photo = None
+grid_water_cleared_photo = None
+grid_water_obstructed_photo = None
+grid_tiles = [None] * GRID_SHIP_SCALE   # grid photo to show, indexed by the ones digit of grid value
 
 game_cheat = False
 
 
 # check eight directions if given location (row, col) is good for ship placing
 def good_location(value, r, c):
-    row, col = int(r), int(c)
-    if game_data[row][col] != GRID_WATER_FREE:   # must be free water
+    location = int(r)*cols + int(c)
+    if game_data[location] != GRID_WATER_FREE:   # must be free water
         return False
-    if row > 0:   # check upper row
-        if game_data[row-1][col] > GRID_WATER_OBSTRUCTED and game_data[row-1][col] != value:
-            return False
-        if col > 0 and game_data[row-1][col-1] > GRID_WATER_OBSTRUCTED and game_data[row-1][col-1] != value:
-            return False
-        if col < cols-1 and game_data[row-1][col+1] > GRID_WATER_OBSTRUCTED and game_data[row-1][col+1] != value:
-            return False
-    if col > 0 and game_data[row][col-1] > GRID_WATER_OBSTRUCTED and game_data[row][col-1] != value:
-        return False   # check left
-    if col < cols-1 and game_data[row][col+1] > GRID_WATER_OBSTRUCTED and game_data[row][col+1] != value:
-        return False   # check right
-    if row < rows-1:   # check lower row
-        if game_data[row+1][col] > GRID_WATER_OBSTRUCTED and game_data[row+1][col] != value:
-            return False
-        if col > 0 and game_data[row+1][col-1] > GRID_WATER_OBSTRUCTED and game_data[row+1][col-1] != value:
-            return False
-        if col < cols-1 and game_data[row+1][col+1] > GRID_WATER_OBSTRUCTED and game_data[row+1][col+1] != value:
+    for i in grid_neighbours[location]:   # neighbours must not be taken by another ship
+        if game_data[i] > GRID_WATER_OBSTRUCTED and game_data[i] != value:
             return False
     return True
 
 
 # when a grid is taken by ship, mark eight directions are no longer available for other ship placing
 def obstruct_neighbour(r, c):
-    row, col = int(r), int(c)
-    global game_data
-    if row > 0:  # upper row
-        if game_data[row-1][col] == GRID_WATER_FREE:
-            game_data[row-1][col] = GRID_WATER_OBSTRUCTED
-        if col > 0 and game_data[row-1][col-1] == GRID_WATER_FREE:
-            game_data[row-1][col-1] = GRID_WATER_OBSTRUCTED
-        if col < cols - 1 and game_data[row-1][col + 1] == GRID_WATER_FREE:
-            game_data[row-1][col + 1] = GRID_WATER_OBSTRUCTED
-    if col > 0 and game_data[row][col-1] == GRID_WATER_FREE:
-        game_data[row][col-1] = GRID_WATER_OBSTRUCTED   # left
-    if col < cols-1 and game_data[row][col+1] == GRID_WATER_FREE:
-        game_data[row][col+1] = GRID_WATER_OBSTRUCTED   # right
-    if row < rows-1:  # lower row
-        if game_data[row+1][col] == GRID_WATER_FREE:
-            game_data[row+1][col] = GRID_WATER_OBSTRUCTED
-        if col > 0 and game_data[row+1][col - 1] == GRID_WATER_FREE:
-            game_data[row+1][col - 1] = GRID_WATER_OBSTRUCTED
-        if col < cols - 1 and game_data[row+1][col + 1] == GRID_WATER_FREE:
-            game_data[row+1][col + 1] = GRID_WATER_OBSTRUCTED
+    for i in grid_neighbours[int(r)*cols + int(c)]:
+        if game_data[i] == GRID_WATER_FREE:
+            game_data[i] = GRID_WATER_OBSTRUCTED
 
 
 def water_cleared(r, c):    # each grid of sunken ship will clear its neighboring water grids
-    row, col = int(r), int(c)
-    global game_data
-    if row > 0:   # upper row
-        if game_data[row-1][col] < GRID_WATER_CLEARED:
-            game_data[row-1][col] = GRID_WATER_CLEARED
-        if col > 0 and game_data[row-1][col - 1] < GRID_WATER_CLEARED:
-            game_data[row-1][col - 1] = GRID_WATER_CLEARED
-        if col < cols - 1 and game_data[row-1][col + 1] < GRID_WATER_CLEARED:
-            game_data[row-1][col + 1] = GRID_WATER_CLEARED
-    if row < rows-1:  # lower row
-        if game_data[row+1][col] < GRID_WATER_CLEARED:
-            game_data[row+1][col] = GRID_WATER_CLEARED
-        if col > 0 and game_data[row+1][col - 1] < GRID_WATER_CLEARED:
-            game_data[row+1][col - 1] = GRID_WATER_CLEARED
-        if col < cols - 1 and game_data[row+1][col + 1] < GRID_WATER_CLEARED:
-            game_data[row+1][col + 1] = GRID_WATER_CLEARED
-    if col > 0 and game_data[row][col-1] < GRID_WATER_CLEARED:
-        game_data[row][col-1] = GRID_WATER_CLEARED  # left
-    if col < cols-1 and game_data[row][col+1] < GRID_WATER_CLEARED:
-        game_data[row][col+1] = GRID_WATER_CLEARED  # right
-
-
-# place n ships of length into ship_locations
-def place_ships(n, length):
-    if n == 0:
-        return
+    for i in grid_neighbours[int(r)*cols + int(c)]:
+        if game_data[i] < GRID_WATER_CLEARED:
+            game_data[i] = GRID_WATER_CLEARED
+            dirty_cells.add(i)
+
+
+# place a ship of length at random location on the board
+def place_ship(length):
     value = GRID_SHIP_SCALE*length + GRID_SHIP_GOOD
     placed = False
     global game_data
@@ -219,7 +190,7 @@ def place_ships(n, length):
         if not good_location(value, row, col):   # current grid is not good to place ship
             continue
         if length == 1:     # ship takes one grid, done
-            game_data[row][col] = value
+            game_data[row*cols + col] = value
             obstruct_neighbour(row, col)
             break
         direction = randint(0, 3)      # ship takes more than one grid, select a direction to probe
@@ -232,7 +203,7 @@ def place_ships(n, length):
             if not good:
                 continue
             for i in range(length):     # have good grids needs by the ship, place whole ship
-                game_data[row][col+i] = value
+                game_data[row*cols + col+i] = value
             for i in range(length):     # mark all neighboring grids not available to place other ship
                 obstruct_neighbour(row, col + i)
                 placed = True
@@ -245,7 +216,7 @@ def place_ships(n, length):
             if not good:
                 continue
             for i in range(length):   # have good grids needs by the ship, place whole ship
-                game_data[row][col-i] = value
+                game_data[row*cols + col-i] = value
             for i in range(length):
                 obstruct_neighbour(row, col-i)
                 placed = True
@@ -258,7 +229,7 @@ def place_ships(n, length):
             if not good:
                 continue
             for i in range(length):   # have good grids needs by the ship, place whole ship
-                game_data[row+i][col] = value
+                game_data[(row+i)*cols + col] = value
             for i in range(length):   # mark all neighboring grids not available to place other ship
                 obstruct_neighbour(row+i, col)
                 placed = True
@@ -271,93 +242,94 @@ def place_ships(n, length):
             if not good:
                 continue
             for i in range(length):  # have good grids needs by the ship, place whole ship
-                game_data[row-i][col] = value
+                game_data[(row-i)*cols + col] = value
             for i in range(length):  # mark all neighboring grids not available to place other ship
                 obstruct_neighbour(row-i, col)
                 placed = True
-    # recursive call to place the next ship
-    place_ships(n-1, length)
 
 
 def init_game():
-    seed(datetime.now())
     global ship_locations, game_data, hits_needed, ships_total, ships_sunken
-    game_data = [[GRID_WATER_FREE] * rows for _ in range(cols)]
-    # place all ships
-    place_ships(1, 4)   # one FOUR
-    place_ships(2, 3)   # two THREE
-    place_ships(3, 2)   # three TWO
-    place_ships(4, 1)   # four ONE
+    game_data = bytearray([GRID_WATER_FREE]) * max_grids
+    # place all ships: one FOUR, two THREE, three TWO, four ONE
+    for n, length in ((1, 4), (2, 3), (3, 2), (4, 1)):
+        for _ in range(n):
+            place_ship(length)
     hits_needed = 1*4 + 2*3 + 3*2 + 4*1   # need this many missile hits to sink all ships
     ships_total = 1+2+3+4    # total ships placed on the board
     ships_sunken = 0         # no ships are sunken yet
 
     # copy ship layout to progress
-    ship_locations = game_data.copy()   # keep a copy of board with ships placed
+    ship_locations = bytes(game_data)   # keep a separate read-only copy of board with ships placed
 
-    global grid_width, grid_height, upper_height
+    global grid_width, grid_height, upper_height, row_lut, col_lut, grid_offsets
     global game_mouse_x_min, game_mouse_x_max, game_mouse_y_min, game_mouse_y_max
     width, height = main_size[0], main_size[1]
     upper_height = round(height * upper_fraction)
     # compute grid width, height, mouse limits for missile targeting
     grid_width = (width - left_margin - right_margin - (cols+1)*line_width)/float(cols)
     grid_height = (upper_height - (rows+1)*line_width)/float(rows)
+    grid_step_x, grid_step_y = int(line_width + grid_width), int(line_width + grid_height)
+    # grid steps are rounded down, so clamp pixels on bottom and right edges into the last row and column
+    row_lut = bytes(min(y//grid_step_y, rows - 1) for y in range(upper_height))
+    col_lut = bytes(min(max(x - left_margin, 0)//grid_step_x, cols - 1) for x in range(width))
+    grid_offsets = [(left_margin + int(col*grid_width + (col+1)*line_width),
+                     int(row*grid_height + (row+1)*line_width)) for row in range(rows) for col in range(cols)]
     game_mouse_x_min = left_margin
     game_mouse_x_max = width - right_margin
     game_mouse_y_min = 0
     game_mouse_y_max = upper_height - 1
-    global grid_ship_burning_jpg, grid_ship_burnt_jpg, grid_water_cleared_jpg
-    global grid_water_obstructed_jpg, grid_ship_good_jpg, radar_photo
+    global grid_background
+    if not grid_background:
+        grid_background = image_ocean.copy()     # make a copy of the ocean image
+        play_draw = ImageDraw.Draw(grid_background)     # make the copy image as drawing canvas
+        for i in range(cols+1):     # draw horizontal grid lines
+            play_draw.line((left_margin + round(i*grid_width+i*line_width), 0,
+                            left_margin + round(i*grid_width+i*line_width), upper_height-line_width),
+                           fill='green', width=line_width)
+        for i in range(rows+1):     # draw vertical grid lines
+            play_draw.line((left_margin, round(i*grid_height+i*line_width), width-right_margin-line_width,
+                            round(i*grid_height+i*line_width)), fill='green', width=line_width)
+    dirty_cells.clear()
+    global grid_ship_burning_photo, grid_ship_burnt_photo, grid_water_cleared_photo
+    global grid_water_obstructed_photo, grid_ship_good_photo, radar_photo
     dx, dy = int(grid_width), int(grid_height)
-    # load images and resize them
-    grid_ship_good_jpg = None
+    # load images, resize them and make photos only once, board size never changes
+    if not grid_ship_burning_photo:
+        grid_ship_burning_jpg = Image.open(cur_directory+"/ship_burning.jpg")
+        grid_ship_burning_photo = ImageTk.PhotoImage(grid_ship_burning_jpg.resize((dx, dy), grid_resample))
+        grid_ship_burnt_jpg = Image.open(cur_directory+"/ship_burnt.jpg")
+        grid_ship_burnt_photo = ImageTk.PhotoImage(grid_ship_burnt_jpg.resize((dx, dy), grid_resample))
+        grid_water_cleared_jpg = Image.open(cur_directory+"/water_cleared.jpg")
+        grid_water_cleared_photo = ImageTk.PhotoImage(grid_water_cleared_jpg.resize((dx, dy), grid_resample))
+        radar_image = Image.open(cur_directory+"/radar.jpg")
+        radar_image = radar_image.resize((100, 100), Image.BILINEAR)
+        radar_photo = ImageTk.PhotoImage(radar_image)
+    grid_ship_good_photo = None
     if game_cheat:
-        grid_ship_good_jpg = Image.new("RGB", (2, 2), color='red')
-    grid_ship_burning_jpg = Image.open(cur_directory+"/ship_burning.jpg")
-    grid_ship_burning_jpg = grid_ship_burning_jpg.resize((dx, dy), Image.BILINEAR)
-    grid_ship_burnt_jpg = Image.open(cur_directory+"/ship_burnt.jpg")
-    grid_ship_burnt_jpg = grid_ship_burnt_jpg.resize((dx, dy), Image.BILINEAR)
-    grid_water_cleared_jpg = Image.open(cur_directory+"/water_cleared.jpg")
-    grid_water_cleared_jpg = grid_water_cleared_jpg.resize((dx, dy), Image.BILINEAR)
-    grid_water_obstructed_jpg = None
-    radar_image = Image.open(cur_directory+"/radar.jpg")
-    radar_image = radar_image.resize((100, 100), Image.BILINEAR)
-    radar_photo = ImageTk.PhotoImage(radar_image)
+        grid_ship_good_photo = ImageTk.PhotoImage(Image.new("RGB", (2, 2), color='red'))
+    grid_water_obstructed_photo = None
+    # GRID_WATER_FREE is not drawn
+    grid_tiles[GRID_WATER_OBSTRUCTED] = grid_water_obstructed_photo
+    grid_tiles[GRID_SHIP_GOOD] = grid_ship_good_photo
+    grid_tiles[GRID_WATER_CLEARED] = grid_water_cleared_photo
+    grid_tiles[GRID_SHIP_BOMBED] = grid_ship_burning_photo
+    grid_tiles[GRID_SHIP_BURNT] = grid_ship_burnt_photo
 
 
 # option 0 - just grids, option 1 - ship locations, option 2 - game data
+# option 2 updates only the grids in dirty_cells on the game canvas
 def draw_game(option):
-    global game_image, game_photo
-    game_image = image_ocean.copy()     # make a copy of the ocean image
-    play_draw = ImageDraw.Draw(game_image)     # make the copy image as drawing canvas
-    width, height = main_size[0], main_size[1]
-    for i in range(cols+1):     # draw horizontal grid lines
-        play_draw.line((left_margin + round(i*grid_width+i*line_width), 0, left_margin+round(i*grid_width+i*line_width),
-                        upper_height-line_width), fill='green', width=line_width)
-    for i in range(rows+1):     # draw vertical grid lines
-        play_draw.line((left_margin, round(i*grid_height+i*line_width), width-right_margin-line_width,
-                        round(i*grid_height+i*line_width)), fill='green', width=line_width)
-    data = None
-    if option == 1:
-        data = ship_locations.copy()   # draw ship placing board
-    elif option == 2:
-        data = game_data.copy()    # draw current game board
-    if data:
-        for row in range(rows):
-            for col in range(cols):
-                offset = (left_margin+int(col*grid_width+(col+1)*line_width), int(row*grid_height+(row+1)*line_width))
-                switcher = {
-                    GRID_WATER_FREE: None,
-                    GRID_WATER_OBSTRUCTED: grid_water_obstructed_jpg,
-                    GRID_SHIP_GOOD: grid_ship_good_jpg,
-                    GRID_WATER_CLEARED: grid_water_cleared_jpg,
-                    GRID_SHIP_BOMBED: grid_ship_burning_jpg,
-                    GRID_SHIP_BURNT: grid_ship_burnt_jpg
-                }
-                grid_image = switcher[data[row][col] % 10]  # select grid image based on the ones digit of grid value
-                if grid_image:  # draw the grid image into that grid
-                    game_image.paste(grid_image, offset)
-    game_photo = ImageTk.PhotoImage(game_image)    # update game_photo to be shown
+    if option == 2:
+        data = game_data    # draw current game board
+        grids = dirty_cells
+    else:
+        data = ship_locations    # draw ship placing board
+        grids = range(max_grids) if option == 1 else []
+    for i in grids:
+        grid_photo = grid_tiles[data[i] % GRID_SHIP_SCALE]  # select grid photo based on ones digit of grid value
+        game_canvas.itemconfigure(grid_items[i], image=grid_photo or "")
+    dirty_cells.clear()
 
 
 # load sound files
@@ -366,7 +338,12 @@ drum_up = cur_directory + "/drumup.wav"
 launch_water = cur_directory + "/launch_water.wav"
 launch_hit = cur_directory + "/launch_hit.wav"
 launch_destroy = cur_directory + "/destroy.wav"
-sound_to_play = drum_up
+sound_waves = {}   # game sound waves loaded in memory (windows), drum up loops from file
+if sys.platform == 'win32':
+    for sound_file in (launch_water, launch_hit, launch_destroy):
+        with open(sound_file, "rb") as f:
+            sound_waves[sound_file] = f.read()
+sound_queue = queue.Queue()   # sound waves waiting to be played by sound thread, None to wake it up
 
 
 # thread class to play sound wave
@@ -376,41 +353,37 @@ class Thread_Sound(threading.Thread):
         self.name = name
 
     def run(self):
-        global exiting, mute_flag, sound_to_play
+        if not mute_flag:
+            play_drum_up()
         while not exiting:
-            sound_playing = sound_to_play
+            sound_playing = sound_queue.get()   # block until a sound wave is requested
+            if sound_playing is None or mute_flag:
+                continue
             if sys.platform == 'win32':
-                if not mute_flag:
-                    winsound.PlaySound(sound_playing, winsound.SND_FILENAME)
-                    if drum_up != sound_playing:
-                        sound_to_play = drum_up
-                else:
-                    time.sleep(0.05)
+                winsound.PlaySound(sound_waves[sound_playing], winsound.SND_MEMORY)   # drum up is stopped
+                if not mute_flag and sound_queue.empty():
+                    play_drum_up()   # resume drum up after game sound
             else:   # not tested path
-                if not mute_flag:
-                    os.system("afplay " + sound_playing)
-                    if drum_up != sound_playing:
-                        sound_to_play = drum_up
-                else:
-                    time.sleep(0.05)
+                os.system("afplay " + sound_playing)
 
 
-class TimerThread(threading.Thread):
-    def __init__(self):
-        threading.Thread.__init__(self)
-        self.stopFlag = False
+def play_drum_up():   # keep playing drum up sound in background until another sound is played
+    if sys.platform == 'win32':
+        winsound.PlaySound(drum_up, winsound.SND_FILENAME | winsound.SND_LOOP | winsound.SND_ASYNC)
 
-    def run(self):
-        while not self.stopFlag:
-            time.sleep(1.0)
-            seconds = time.time() - game_start_time  # game time in seconds
-            time_string = "Time in game: " + time.strftime('%H:%M:%S', time.gmtime(seconds))
-            if gaming:
-                game_time_label.configure(text=time_string)
-                game_time_label.update()
 
-    def stop(self):
-        self.stopFlag = True
+def stop_sound():   # stop any sound being played
+    if sys.platform == 'win32':
+        winsound.PlaySound(None, 0)
+
+
+def play_sound(sound):   # request sound thread to play a game sound
+    global sound_thread
+    if not sound_thread:
+        sound_thread = Thread_Sound("Sound")
+        sound_thread.start()
+    if not mute_flag:
+        sound_queue.put(sound)
 
 
 def unmute_sound():
@@ -419,26 +392,32 @@ def unmute_sound():
     if not sound_thread:
         sound_thread = Thread_Sound("Sound")
         sound_thread.start()
+    else:
+        play_drum_up()
 
 
 def mute_sound():
-    global sound_thread, mute_flag
+    global mute_flag
     mute_flag = True
-    if not sound_thread:
-        sound_thread = Thread_Sound("Sound")
-        sound_thread.start()
+    with sound_queue.mutex:   # drop game sounds not played yet
+        sound_queue.queue.clear()
+    stop_sound()
 
 
 def on_exit():
     global sound_thread, exiting
     if sound_thread:    # shut down sound playing thread
         exiting = True
+        stop_sound()
+        sound_queue.put(None)   # wake up sound thread waiting for sound wave
         sound_thread.join()
         sound_thread = None
     main_window.quit()  # kill GUI
 
 
-def handle_keypress(event):
+def handle_keypress(event):  # bound once for the whole program, key presses are ignored while gaming
+    if gaming:
+        return
     if str(event.char).upper() == "Q":
         on_exit()
     elif str(event.char).upper() == "S":
@@ -448,10 +427,19 @@ def handle_keypress(event):
 
 # create main view
 bg_color = '#195580'
+LABEL_FONT = ("Courier", 16, 'bold')   # font of labels, buttons and radio buttons
+TITLE_FONT = ("Courier", 48, 'bold')   # font of game ending message
+# common options of game information labels
+LABEL_KW = dict(borderwidth=2, bg=bg_color, activebackground=bg_color, font=LABEL_FONT, padx=20, pady=5)
 main_window = ui.Tk()
 main_window.title("Battleship War")
 main_window.wm_attributes('-fullscreen', 'true')
 main_window.configure(bg=bg_color)
+# text variables of game information labels in game view
+game_missiles_var = ui.StringVar()
+game_miss_var = ui.StringVar()
+game_ships_live_var = ui.StringVar()
+game_ships_sunken_var = ui.StringVar()
 # construct upper panel for main view
 main_size = (main_window.winfo_screenwidth(), main_window.winfo_screenheight())
 image_ocean = Image.open(cur_directory+"/ocean.jpg")
@@ -484,16 +472,16 @@ missiles_total = 50
 middle_panel = ui.Frame(master=main_window, bg=bg_color, padx=2, pady=2)
 level_label = ui.Label(master=middle_panel, text="Please select your experience level", bg=bg_color,
                        font=("Courier", 32, 'bold')).grid(row=0, column=0, sticky="w")
-ui.Radiobutton(master=middle_panel, text="Amateur - 45 missiles available", font=("Courier", 16, 'bold'), bg=bg_color,
+ui.Radiobutton(master=middle_panel, text="Amateur - 45 missiles available", font=LABEL_FONT, bg=bg_color,
                activebackground=bg_color, padx=50, variable=player_skill, value=0,
                command=on_skill).grid(row=1, column=0, columnspan=3, sticky="w")
-ui.Radiobutton(master=middle_panel, text="Novice - 40 missiles available", font=("Courier", 16, 'bold'), bg=bg_color,
+ui.Radiobutton(master=middle_panel, text="Novice - 40 missiles available", font=LABEL_FONT, bg=bg_color,
                activebackground=bg_color, padx=50, variable=player_skill, value=1,
                command=on_skill).grid(row=2, column=0, columnspan=3, sticky="w")
-ui.Radiobutton(master=middle_panel, text="Intermediate - 35 missiles available", font=("Courier", 16, 'bold'),
+ui.Radiobutton(master=middle_panel, text="Intermediate - 35 missiles available", font=LABEL_FONT,
                bg=bg_color, activebackground=bg_color, padx=50, variable=player_skill, value=2,
                command=on_skill).grid(row=3, column=0, columnspan=3, sticky="w")
-ui.Radiobutton(master=middle_panel, text="Expert - 30 missiles available", font=("Courier", 16, 'bold'), bg=bg_color,
+ui.Radiobutton(master=middle_panel, text="Expert - 30 missiles available", font=LABEL_FONT, bg=bg_color,
                activebackground=bg_color, padx=50, variable=player_skill, value=3,
                command=on_skill).grid(row=4, column=0, columnspan=3, sticky="w")
 middle_panel.place(x=round(main_size[0]*0.25), y=round(main_size[1]*upper_fraction)+1,
@@ -506,87 +494,73 @@ def game_keypress(event):
         main_window.focus()
 
 
+def load_missile_images():   # load missile animation images if not yet
+    global missile_atlas, hit_jpg, missed_jpg
+    global missile_photos, hit_photo, missed_photo
+    image_size = (100, 100)
+    if not hit_jpg:   # load hit jpg and resize if not yet
+        hit_jpg = Image.open(cur_directory + "/hit.jpg")
+        hit_jpg = hit_jpg.resize(image_size, Image.BILINEAR)
+        hit_photo = ImageTk.PhotoImage(hit_jpg)
+    if not missed_jpg:  # load missed jpg and resize if not yet
+        missed_jpg = Image.open(cur_directory + "/missed.jpg")
+        missed_jpg = missed_jpg.resize(image_size, Image.BILINEAR)
+        missed_photo = ImageTk.PhotoImage(missed_jpg)
+
+    if not missile_atlas:  # load animation images into sprite sheet if not yet
+        frame_width, frame_height = image_size
+        missile_atlas = Image.new("RGB", (frame_width, frame_height*missile_frames))
+        for i in range(missile_frames):
+            missile_image_name = cur_directory + "/frame" + str(i) + ".jpg"
+            with Image.open(missile_image_name) as image:
+                missile_atlas.paste(image.resize(image_size, Image.BILINEAR), (0, frame_height*i))
+        missile_photos = [ImageTk.PhotoImage(missile_atlas.crop((0, frame_height*i, frame_width, frame_height*(i+1))))
+                          for i in range(missile_frames)]
+
+
+# search east, west, south and north of grid (row, col) for bombed grids of the same ship
+def find_ship_hits(row, col, length, ship_hits):
+    for dr, dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+        for idx in range(1, length):
+            r, c = row + dr*idx, col + dc*idx
+            if not (0 <= r < rows and 0 <= c < cols):
+                break   # stop at out of board
+            val = game_data[r*cols + c]
+            if val // GRID_SHIP_SCALE != length or val % GRID_SHIP_SCALE != GRID_SHIP_BOMBED:
+                break   # not belong to this ship or not bombed
+            ship_hits.append((r, c))    # belong to this ship and bombed
+
+
 def handle_click(event):   # mouse click to launch missile if allowed
-    if not gaming or not (game_mouse_x_min <= event.x <= game_mouse_x_max and
-                          game_mouse_y_min <= event.y <= game_mouse_y_max):
-        return    # click is not on the game board, ignore
+    global missile_show, animating
+    if not gaming or animating or not (game_mouse_x_min <= event.x <= game_mouse_x_max and
+                                       game_mouse_y_min <= event.y <= game_mouse_y_max):
+        return    # click is not on the game board or missile is still flying, ignore
     global game_missiles_label, game_hits_label, game_miss_label, game_missile_left, game_hits, game_miss
 
     row, col = mouse_in_grid(event.x, event.y)
     global game_data
-    val = game_data[row][col]
+    val = game_data[row*cols + col]
     if val == GRID_WATER_CLEARED:
         return   # click is on cleared water, ignore
 
-    if val % GRID_SHIP_SCALE == GRID_SHIP_BOMBED or val % GRID_SHIP_SCALE == GRID_SHIP_BURNT:
+    length, status = divmod(val, GRID_SHIP_SCALE)   # ship length (tens digit) and grid status (ones digit)
+    if status == GRID_SHIP_BOMBED or status == GRID_SHIP_BURNT:
         return   # click is on ship already hit, ignore
 
-    length = val // GRID_SHIP_SCALE   # calculate the ship length (tens digit)
     ship_hits = []   # list of hits the ship suffered so as to determine this is the last hit to sink the ship
     if val == GRID_WATER_FREE or val == GRID_WATER_OBSTRUCTED:  # hit water
         game_missile_left -= 1
         game_miss += 1
-    elif val % GRID_SHIP_SCALE == GRID_SHIP_GOOD:    # hit ship
+    elif status == GRID_SHIP_GOOD:    # hit ship
         game_missile_left -= 1
         game_hits += 1
         ship_hits.append((row, col))
         if length > 1:    # the ship length is more than one, find out all hits it suffered
-            for idx in range(1, length):  # search the east direction
-                if col+idx >= cols:   # stop at out of board
-                    break
-                elif game_data[row][col+idx] // GRID_SHIP_SCALE != length:  # not belong to this ship
-                    break
-                elif game_data[row][col+idx] // GRID_SHIP_SCALE == length and \
-                        game_data[row][col+idx] % GRID_SHIP_SCALE == GRID_SHIP_BOMBED:
-                    ship_hits.append((row, col+idx))    # belong to this ship and bombed
-                else:
-                    break
-            for idx in range(1, length):  # search the west direction
-                if col - idx < 0:
-                    break
-                elif game_data[row][col-idx] // GRID_SHIP_SCALE != length:
-                    break
-                elif game_data[row][col-idx] // GRID_SHIP_SCALE == length and \
-                        game_data[row][col-idx] % GRID_SHIP_SCALE == GRID_SHIP_BOMBED:
-                    ship_hits.append((row, col-idx))
-                else:
-                    break
-            for idx in range(1, length):  # search the south direction
-                if row+idx >= rows:
-                    break
-                elif game_data[row+idx][col] // GRID_SHIP_SCALE != length:
-                    break
-                elif game_data[row+idx][col] // GRID_SHIP_SCALE == length and \
-                        (game_data[row+idx][col] % GRID_SHIP_SCALE) == GRID_SHIP_BOMBED:
-                    ship_hits.append((row+idx, col))
-                else:
-                    break
-            for idx in range(1, length):  # search the north direction
-                if row - idx < 0:
-                    break
-                elif game_data[row-idx][col] // GRID_SHIP_SCALE != length:
-                    break
-                elif game_data[row-idx][col] // GRID_SHIP_SCALE == length and \
-                        game_data[row-idx][col] % GRID_SHIP_SCALE == GRID_SHIP_BOMBED:
-                    ship_hits.append((row-idx, col))
-                else:
-                    break
-
-    global image_missiles, sound_to_play, mute_flag, hit_jpg, missed_jpg
-    image_size = (100, 100)
-    if not hit_jpg:   # load hit jpg and resize if not yet
-        hit_jpg = Image.open(cur_directory + "/hit.jpg")
-        hit_jpg = hit_jpg.resize(image_size, Image.BILINEAR)
-    if not missed_jpg:  # load missed jpg and resize if not yet
-        missed_jpg = Image.open(cur_directory + "/missed.jpg")
-        missed_jpg = missed_jpg.resize(image_size, Image.BILINEAR)
+            find_ship_hits(row, col, length, ship_hits)
 
-    if len(image_missiles) == 0:  # load animation images if not yet
-        for i in range(30):
-            missile_image_name = cur_directory + "/frame" + str(i) + ".jpg"
-            image = Image.open(missile_image_name)
-            image = image.resize(image_size, Image.BILINEAR)
-            image_missiles.append(image)
+    load_missile_images()   # normally preloaded while main view is shown
+    animating = True    # ignore further clicks until the animation is finished
     missile_show = ui.Label(master=main_window)
     loc_x, loc_y = event.x, event.y
     if col == cols - 1:
@@ -594,90 +568,113 @@ def handle_click(event):   # mouse click to launch missile if allowed
     if row == rows - 1:
         loc_y = int(loc_y - grid_height/2)
     missile_show.place(x=loc_x, y=loc_y)     # to display animation near mouse pointer
-    time.sleep(1.0)    # give time to finish current sound wave
     if len(ship_hits) == 0:  # hit water
-        game_data[row][col] = GRID_WATER_CLEARED   # update hit grid value
-        sound_to_play = launch_water   # sound wave to play
+        game_data[row*cols + col] = GRID_WATER_CLEARED   # update hit grid value
+        dirty_cells.add(row*cols + col)
+        sound = launch_water   # sound wave to play
         duration = 3.0   # sound duration
     elif len(ship_hits) < length:   # update hit grid value, hit the ship but not last hit
-        game_data[row][col] = length*GRID_SHIP_SCALE + GRID_SHIP_BOMBED
-        sound_to_play = launch_hit
+        game_data[row*cols + col] = length*GRID_SHIP_SCALE + GRID_SHIP_BOMBED
+        dirty_cells.add(row*cols + col)
+        sound = launch_hit
         duration = 2.0
     else:  # last hit for the ship
-        sound_to_play = launch_destroy
+        sound = launch_destroy
         global ships_sunken
         ships_sunken += 1      # sink a ship
         duration = 4.0
         for i in range(len(ship_hits)):
             row, col = ship_hits[i]
-            game_data[row][col] = length*GRID_SHIP_SCALE + GRID_SHIP_BURNT
+            game_data[row*cols + col] = length*GRID_SHIP_SCALE + GRID_SHIP_BURNT
+            dirty_cells.add(row*cols + col)
             water_cleared(row, col)
 
-    if not mute_flag:
-        unmute_sound()
+    # last fame of animation, either hit or miss
+    if len(ship_hits) == 0:
+        last_photo = missed_photo
     else:
-        mute_sound()
-    interval = (duration - 0.3)/30
-    for i in range(30):    # animation of 30 frames
-        photo_frame = ImageTk.PhotoImage(image_missiles[i])
-        missile_show.configure(image=photo_frame)
-        missile_show.update()
-        time.sleep(interval)
+        last_photo = hit_photo
+    start_animation(sound, duration, last_photo)   # the animation runs from the Tk event loop
 
-    # last fame of animation, either hit or miss
-    if game_data[row][col] == GRID_WATER_CLEARED:
-        photo_frame = ImageTk.PhotoImage(missed_jpg)
+
+def start_animation(sound, duration, last_photo):   # play launch sound and start missile animation
+    play_sound(sound)
+    interval = round((duration - 0.3)/missile_frames*1000)   # in milliseconds
+    show_frame(0, interval, last_photo)
+
+
+def show_frame(i, interval, last_photo):   # show i-th animation frame and schedule the next one
+    if i < len(missile_photos):
+        missile_show.configure(image=missile_photos[i])
+        main_window.after(interval, show_frame, i+1, interval, last_photo)
     else:
-        photo_frame = ImageTk.PhotoImage(hit_jpg)
+        missile_show.configure(image=last_photo)
+        main_window.after(300, finish_animation)
 
-    missile_show.configure(image=photo_frame)
-    missile_show.update()
-    time.sleep(0.3)
 
+def finish_animation():   # update game board and information once missile animation is done
+    global animating
     missile_show.destroy()   # clear animation window
+    animating = False
+    if not gaming:
+        return   # game was quit during the animation
     draw_game(2)             # update the game board
-    global game_upper_label
-    game_upper_label.configure(image=game_photo)
-    game_upper_label.place(x=0, y=0, relwidth=1.0, relheight=1.0)
-    # update game information
-    game_missiles_label.configure(text="Missiles(Available): "+str(game_missile_left))
-    game_missiles_label.update()
-    game_miss_label.configure(text="Missile Missed: "+str(game_miss))
-    game_miss_label.update()
-    game_ships_live_label.configure(text="Ships(to sink): "+str(ships_total-ships_sunken))
-    game_ships_live_label.update()
-    game_ships_sunken_label.configure(text="Ships Sunken: "+ str(ships_sunken))
-    game_ships_sunken_label.update()
+    update_game_info()
+    main_window.update_idletasks()   # redraw board and information at once
 
     # game over if ships are all hit or missiles are used up
     if game_hits == hits_needed or game_missile_left == 0:
         game_end()
 
 
-def mouse_in_grid(x, y):  # convert mouse coordinate to board location
-    x -= left_margin
-    row, col = int(y)//int(line_width+grid_height), int(x)//int(line_width+grid_width)
-    if row >= rows:
-        row = rows - 1
-    if col >= cols:
-        col = cols - 1
-    return row, col
+def update_game_info():   # update game information, labels follow their text variables
+    game_missiles_var.set("Missiles(Available): "+str(game_missile_left))
+    game_miss_var.set("Missile Missed: "+str(game_miss))
+    game_ships_live_var.set("Ships(to sink): "+str(ships_total-ships_sunken))
+    game_ships_sunken_var.set("Ships Sunken: "+str(ships_sunken))
 
 
-def handle_mouse_move(event):  # update missile aiming location if within game board
+def mouse_in_grid(x, y):  # convert mouse coordinate to board location
+    return row_lut[y], col_lut[x]
+
+
+def handle_mouse_move(event):  # keep latest mouse location, missile aiming location is updated by flush_aim
+    global aim_position, aim_scheduled
+    aim_position = None
+    if gaming and game_mouse_x_min <= event.x <= game_mouse_x_max and game_mouse_y_min <= event.y <= game_mouse_y_max:
+        aim_position = (event.x, event.y)
+    if not aim_scheduled:   # motion events until then only move aim_position
+        aim_scheduled = True
+        main_window.after(16, flush_aim)
+
+
+def flush_aim():  # update missile aiming location if within game board, about 60 times a second at most
+    global aim_scheduled, aim_cell
+    aim_scheduled = False
+    if not gaming:
+        return   # game view is gone
+    cell = mouse_in_grid(*aim_position) if aim_position else None
+    if cell == aim_cell:
+        return   # still aiming at the same grid, label is up to date
+    aim_cell = cell
     coord_text = ""
-    if gaming and event.widget == game_upper_label and \
-            game_mouse_x_min <= event.x <= game_mouse_x_max and game_mouse_y_min <= event.y <= game_mouse_y_max:
-        row, col = mouse_in_grid(event.x, event.y)
-        coord_text = "Aim at ({:1d},{:1d})".format(row, col)
-    game_coord_label.configure(text=coord_text)
-    game_coord_label.update()
+    if cell:
+        coord_text = aim_texts[cell[0]][cell[1]]
+    game_coord_label.configure(text=coord_text)   # redrawn by main loop once motion events are handled
+
+
+def game_tick():  # update game time every second while game is active
+    global game_timer
+    seconds = time.time() - game_start_time  # game time in seconds
+    time_string = "Time in game: " + time.strftime('%H:%M:%S', time.gmtime(seconds))
+    game_time_label.configure(text=time_string)
+    game_timer = main_window.after(1000, game_tick)
 
 
 def game_end():  # handle the end of game
-    global sound_to_play, gaming
+    global gaming
     gaming = False
-    timer_thread.stop()   # stop timer thread
+    main_window.after_cancel(game_timer)   # stop updating game time
     game_duration_seconds = time.time() - game_start_time   # time spent on the game
     time_string = "\nTime in game: " + time.strftime('%H:%M:%S', time.gmtime(game_duration_seconds))
     if game_hits == hits_needed:
@@ -688,20 +685,14 @@ def game_end():  # handle the end of game
         message = "You Quit."
     message = message + time_string
     # display game ending message
-    ui.Label(master=game_upper_panel, text=message, font=("Courier", 48, 'bold'))\
+    ui.Label(master=game_upper_panel, text=message, font=TITLE_FONT)\
         .place(x=round(main_size[0] * 0.28), y=round(main_size[1] * 0.18))
-    game_upper_panel.update()
     game_quit_button["state"] = "disabled"
     game_sound_button["state"] = "disabled"
-    game_lower_panel.update()
+    main_window.update_idletasks()   # paint ending message and disabled buttons before the message box shows
+    from tkinter import messagebox   # only needed once a game ends
     messagebox.showinfo(title=None, message=message)
-    main_window.unbind("<Motion>")     # no longer track mouse motion
-    main_window.unbind("<Button 1>")   # no longer track mouse click
-    game_upper_panel.destroy()    # dismiss upper panel of game view
-    game_middle_panel.destroy()   # dismiss middle panel of game view
-    game_lower_panel.destroy()    # dismiss lower panel of game view
-    main_window.bind("<Key>", handle_keypress)   # resume key press handler
-    sound_to_play = drum_up       # play drum up sound in main view
+    game_root_frame.destroy()     # dismiss all panels of game view at once
 
 
 def on_sound():    # sound on/off toggle handler in main view
@@ -711,7 +702,6 @@ def on_sound():    # sound on/off toggle handler in main view
     else:
         sound_button['text'] = "Sound On"
         unmute_sound()
-    sound_button.update()
 
 
 def on_game_sound():  # sound on/off toggle handler in game view
@@ -721,104 +711,105 @@ def on_game_sound():  # sound on/off toggle handler in game view
     else:
         game_sound_button['text'] = "Sound On"
         unmute_sound()
-    game_sound_button.update()
 
 
 def start_play():  # Play button click handler to construct game and game view
     global game_photo, game_sound_button, game_upper_panel, game_middle_panel, game_lower_panel, mute_flag
-    global game_upper_label, game_missile_left, game_hits, game_miss
+    global game_canvas, grid_items, game_missile_left, game_hits, game_miss, aim_cell
     game_missile_left = missiles_total
+    aim_cell = None   # new game_coord_label is empty
     game_hits = 0
     game_miss = 0
 
     init_game()
-    draw_game(1)
 
     game_color = bg_color
+    global game_root_frame
+    game_root_frame = ui.Frame(master=main_window, bg=game_color)   # placed once the whole game view is built
     # upper panel of game view
-    game_upper_panel = ui.Frame(master=main_window, bg=game_color, padx=0, pady=0)
-    game_upper_panel.place(x=0, y=0, relwidth=1.0, relheight=upper_fraction)
-    game_upper_label = ui.Label(master=game_upper_panel)
-    game_upper_label.configure(image=game_photo)
-    game_upper_label.place(x=0, y=0, relwidth=1.0, relheight=1.0)
-    main_window.bind("<Motion>", handle_mouse_move)  # set mouse motion handler
-    game_upper_label.bind("<Button 1>", handle_click)  # set mouse click handler
+    game_upper_panel = ui.Frame(master=game_root_frame, bg=game_color, padx=0, pady=0)
+    game_canvas = ui.Canvas(master=game_upper_panel, bg=game_color, borderwidth=0, highlightthickness=0)
+    if not game_photo:   # background never changes, so all games share one photo
+        game_photo = ImageTk.PhotoImage(grid_background)
+    game_canvas.create_image(0, 0, anchor="nw", image=game_photo)
+    grid_items = [game_canvas.create_image(offset, anchor="nw") for offset in grid_offsets]
+    draw_game(1)
+    game_canvas.place(x=0, y=0, relwidth=1.0, relheight=1.0)
+    game_canvas.bind("<Motion>", handle_mouse_move)  # set mouse motion handler
+    game_canvas.bind("<Leave>", handle_mouse_move)   # clear missile aiming location when mouse leaves board
+    game_canvas.bind("<Button 1>", handle_click)  # set mouse click handler
+    game_upper_panel.place(x=0, y=0, relwidth=1.0, relheight=upper_fraction)   # place panel once it is built
     # construct middle panel of game view
-    game_middle_panel = ui.Frame(master=main_window, bg=game_color, padx=2, pady=2)
+    game_middle_panel = ui.Frame(master=game_root_frame, bg=game_color, padx=2, pady=2)
+    game_middle_panel.grid_propagate(False)   # panel size is set by place, not by its children
     game_middle_panel.columnconfigure([0, 1, 2, 3, 4],  minsize=round(main_size[0] * 0.16), weight=1)
-    game_middle_panel.rowconfigure([0, 1, 3, 4],  minsize=30, weight=1)
+    game_middle_panel.rowconfigure([0, 1, 2, 3, 4],  minsize=30, weight=1)   # configure all rows like columns
     global game_coord_label, game_missiles_label, game_ships_live_label, game_miss_label, game_ships_sunken_label
-    game_coord_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color, activebackground=game_color,
-                                text="", font=("Courier", 16, 'bold'), padx=20, pady=5)
+    game_coord_label = ui.Label(master=game_middle_panel, text="", **LABEL_KW)
     game_coord_label.grid(row=0, column=2, sticky="n")
 
     radar_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color, activebackground=game_color,
                            image=radar_photo, padx=20, pady=5)
     radar_label.grid(row=1, column=2, rowspan=2, sticky="n")
 
-    game_missiles_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color, activebackground=game_color,
-                                   text="Missiles(Available): "+str(game_missile_left),
-                                   font=("Courier", 16, 'bold'), padx=20, pady=5)
+    update_game_info()
+    game_missiles_label = ui.Label(master=game_middle_panel, textvariable=game_missiles_var, **LABEL_KW)
     game_missiles_label.grid(row=1, column=1, sticky="w")
-    game_ships_live_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color,
-                                     activebackground=game_color, text="Ships(to sink): "+str(ships_total),
-                                     font=("Courier", 16, 'bold'), padx=20, pady=5)
+    game_ships_live_label = ui.Label(master=game_middle_panel, textvariable=game_ships_live_var, **LABEL_KW)
     game_ships_live_label.grid(row=2, column=1, sticky="w")
 
-    game_miss_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color, activebackground=game_color,
-                               text="Missile Missed: "+str(game_miss), font=("Courier", 16, 'bold'), padx=20, pady=5)
+    game_miss_label = ui.Label(master=game_middle_panel, textvariable=game_miss_var, **LABEL_KW)
     game_miss_label.grid(row=1, column=3, sticky="w")
-    game_ships_sunken_label = ui.Label(master=game_middle_panel, borderwidth=2, bg=game_color,
-                                       activebackground=game_color, text="Ships Sunken: "+ str(ships_sunken),
-                                       font=("Courier", 16, 'bold'), padx=20, pady=5)
+    game_ships_sunken_label = ui.Label(master=game_middle_panel, textvariable=game_ships_sunken_var, **LABEL_KW)
     game_ships_sunken_label.grid(row=2, column=3, sticky="w")
     game_middle_panel.place(x=0, y=round(main_size[1] * upper_fraction) + 1, relwidth=1.0, relheight=middle_fraction)
     # lower panel of game view
-    game_lower_panel = ui.Frame(master=main_window, bg=game_color, padx=0, pady=0)
+    game_lower_panel = ui.Frame(master=game_root_frame, bg=game_color, padx=0, pady=0)
+    game_lower_panel.grid_propagate(False)
     game_lower_panel.columnconfigure([0, 1, 2, 3], minsize=round(main_size[0] * 0.25), weight=1)
     global game_quit_button
     game_quit_button = ui.Button(master=game_lower_panel, width=8, borderwidth=2, bg=game_color,
-                                 activebackground=game_color, font=("Courier", 16, 'bold'),
+                                 activebackground=game_color, font=LABEL_FONT,
                                  text="Quit", command=game_end)
     game_quit_button.grid(row=0, column=2, sticky="e")
     global game_time_label
     game_time_label = ui.Label(master=game_lower_panel, borderwidth=2, bg=game_color,
-                               activebackground=game_color, text="", font=("Courier", 16, 'bold'))
+                               activebackground=game_color, text="", font=LABEL_FONT)
     game_time_label.grid(row=0, column=1, sticky="n")
     sound_text = "Sound On"
     if mute_flag:
         sound_text = "Sound Off"
     game_sound_button = ui.Button(master=game_lower_panel, width=10, borderwidth=2, bg=bg_color,
                                   activebackground=bg_color,
-                                  font=("Courier", 16, 'bold'), text=sound_text, command=on_game_sound)
+                                  font=LABEL_FONT, text=sound_text, command=on_game_sound)
     game_sound_button.grid(row=0, column=3, sticky="n")
     game_lower_panel.place(x=0, y=round(main_size[1] * (1 - lower_fraction)) + 1,
                            relwidth=1.0, relheight=lower_fraction)
-    main_window.unbind("<Key>")   # stop handle key press events
-    global gaming, game_start_time, timer_thread
+    global gaming, game_start_time, game_timer
     gaming = True
     game_upper_panel.config(cursor="crosshair")
+    game_root_frame.place(x=0, y=0, relwidth=1.0, relheight=1.0)   # show game view in a single geometry pass
     game_start_time = time.time()
-    timer_thread = TimerThread()
-    timer_thread.start()
+    game_timer = main_window.after(1000, game_tick)
 
 
 # lower panel of main view
 lower_panel = ui.Frame(master=main_window, bg=bg_color, padx=0, pady=0)
 lower_panel.columnconfigure([0, 1, 2], minsize=round(main_size[0]*0.33), weight=1)
 ui.Button(master=lower_panel, width=8, borderwidth=2, bg=bg_color, activebackground=bg_color,
-          font=("Courier", 16, 'bold'), text="Play", command=start_play).grid(row=0, column=0, sticky="e")
+          font=LABEL_FONT, text="Play", command=start_play).grid(row=0, column=0, sticky="e")
 exit_button = ui.Button(master=lower_panel, width=8, borderwidth=2, bg=bg_color, activebackground=bg_color,
-                        font=("Courier", 16, 'bold'), text="Exit", command=on_exit)
+                        font=LABEL_FONT, text="Exit", command=on_exit)
 exit_button.grid(row=0, column=1, sticky="n")
 lower_panel.place(x=0, y=round(main_size[1]*(1-lower_fraction))+1, relwidth=1.0, relheight=lower_fraction)
 
 
 sound_button = ui.Button(master=lower_panel, width=10, borderwidth=2, bg=bg_color, activebackground=bg_color,
-                         font=("Courier", 16, 'bold'), text="Sound On", command=on_sound)
+                         font=LABEL_FONT, text="Sound On", command=on_sound)
 sound_button.grid(row=0, column=2, sticky="w")
 # app exit handler
 main_window.protocol('WM_DELETE_WINDOW', on_exit)
+main_window.after(100, load_missile_images)   # load animation images while player reads main view
 main_window.mainloop()     # app main message loop until exit
 
 